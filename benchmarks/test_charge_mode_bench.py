@@ -0,0 +1,31 @@
+from conftest import dbus_aggregate_batteries
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+AggregatedChargeMode = dbus_aggregate_batteries.AggregatedChargeMode
+
+# ===========================================================================
+
+
+@pytest.mark.parametrize(
+    "charge_modes",
+    [
+        ["Bulk", "Absorption"],
+        ["Float", "Float Transition", "Float"],
+        ["Bulk", "Float", "Float Transition"],
+        ["Bulk"] * 16,
+    ],
+    ids=["bulk_or_absorption", "float_transition", "mixed", "16_batteries_bulk"],
+)
+def test_update_aggregated_charge_mode(benchmark, service, charge_modes):
+    benchmark(service._update_aggregated_charge_mode, charge_modes)
+
+
+def test_get_cvl_with_aggregated_charge_mode(benchmark, service):
+    service._aggregated_charge_mode = AggregatedChargeMode.FLOAT_TRANSITION
+    voltages = [55.0, 57.0, 55.2]
+    modes = ["Float Transition", "Float Transition", "Bulk"]
+
+    assert benchmark(service._get_cvl_with_aggregated_charge_mode, voltages, modes) == 55.2
@@ -0,0 +1,47 @@
+from conftest import make_frame
+from vedirect_shunt_monitor import VeDirectParser
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+# ---------------------------------------------------------------------------
+# Helpers and fixtures
+# ---------------------------------------------------------------------------
+
+
+# A typical SmartShunt text frame.
+_SHUNT_FRAME = make_frame(
+    {
+        "PID": "0xA389",
+        "V": "53250",
+        "VS": "12710",
+        "I": "-4520",
+        "P": "-241",
+        "CE": "-35210",
+        "SOC": "862",
+        "TTG": "1130",
+        "Alarm": "OFF",
+        "AR": "0",
+        "BMV": "SmartShunt 500A/50mV",
+        "FW": "0421",
+        "MON": "0",
+    }
+)
+# About 1 KB of consecutive frames.
+_SHUNT_DATA = _SHUNT_FRAME * (1024 // len(_SHUNT_FRAME) + 1) + b"\r\n"
+
+
+# ===========================================================================
+
+
+def test_parser_next_frame(benchmark):
+    def parse():
+        parser = VeDirectParser()
+        parser.feed(_SHUNT_DATA)
+        frames = 0
+        while parser.next_frame() is not None:
+            frames += 1
+        return frames
+
+    assert benchmark(parse) == _SHUNT_DATA.count(b"Checksum\t")
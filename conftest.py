@@ -0,0 +1,75 @@
+import importlib.util
+import os
+import pytest
+import sys
+from functions import Functions
+from types import ModuleType, SimpleNamespace
+
+# ---------------------------------------------------------------------------
+# Stub external dependencies before the test and benchmark modules import the
+# code under test. This root conftest.py is imported once per session for both
+# tests/ and benchmarks/, so the stubs are only created once. Plain modules
+# are used instead of MagicMock because only the presence of the imported
+# names matters; no test inspects calls on them.
+# ---------------------------------------------------------------------------
+
+
+class _MockBusConnection:
+    """Stand-in for dbus.bus.BusConnection enabling class inheritance."""
+
+    TYPE_SYSTEM = 0
+    TYPE_SESSION = 1
+
+
+def _stub_module(name: str, **attrs) -> ModuleType:
+    module = ModuleType(name)
+    module.__dict__.update(attrs)
+    return module
+
+
+_stub_dbus_bus = _stub_module("dbus.bus", BusConnection=_MockBusConnection)
+
+for _module in (
+    _stub_module("gi"),
+    _stub_module("gi.repository", GLib=SimpleNamespace()),
+    _stub_module("dbus", bus=_stub_dbus_bus),
+    _stub_dbus_bus,
+    _stub_module("settings"),
+    _stub_module("dbusmon", DbusMon=SimpleNamespace),
+    _stub_module("serial"),
+    _stub_module("vedbus", VeDbusService=SimpleNamespace, VeDbusItemImport=SimpleNamespace),
+):
+    sys.modules[_module.__name__] = _module
+
+# ---------------------------------------------------------------------------
+# Import the module under test (filename contains hyphens) once per session
+# ---------------------------------------------------------------------------
+
+if "dbus_aggregate_batteries" not in sys.modules:
+    _spec = importlib.util.spec_from_file_location("dbus_aggregate_batteries", os.path.join(os.path.dirname(__file__), "dbus-aggregate-batteries.py"))
+    sys.modules["dbus_aggregate_batteries"] = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(sys.modules["dbus_aggregate_batteries"])
+
+dbus_aggregate_batteries = sys.modules["dbus_aggregate_batteries"]
+
+# ---------------------------------------------------------------------------
+# Helpers shared by tests and benchmarks
+# ---------------------------------------------------------------------------
+
+# Functions is a stateless helper bag, so all services share one instance.
+_FUNCTIONS = Functions()
+
+
+@pytest.fixture
+def service():
+    """Lightweight DbusAggBatService that bypasses __init__."""
+    svc = object.__new__(dbus_aggregate_batteries.DbusAggBatService)
+    svc._aggregated_charge_mode = dbus_aggregate_batteries.AggregatedChargeMode.FLOAT
+    svc._fn = _FUNCTIONS
+    return svc
+
+
+def make_frame(fields: dict) -> bytes:
+    """Build a VE.Direct text frame with a valid trailing checksum byte."""
+    body = b"".join(b"\r\n" + key.encode() + b"\t" + value.encode() for key, value in fields.items()) + b"\r\nChecksum\t"
+    return body + bytes([-sum(body) & 0xFF])
@@ -52,6 +52,66 @@ class AggregatedChargeMode(Enum):
     FLOAT = 3
 
 
+def _get_charge_mode_category(mode: str) -> AggregatedChargeMode:
+    """Map a battery's /Info/ChargeMode text to the aggregated charge mode category it belongs to."""
+    if "Float Transition" in mode:
+        return AggregatedChargeMode.FLOAT_TRANSITION
+    if "Float" in mode:
+        return AggregatedChargeMode.FLOAT
+    return AggregatedChargeMode.BULK_OR_ABSORPTION
+
+
+# Next aggregated charge mode, keyed by the set of charge mode categories present among the batteries.
+# Combinations not listed here leave the aggregated charge mode unchanged.
+_AGGREGATED_CHARGE_MODE_TRANSITIONS = {
+    # All batteries are in Bulk or Absorbtion mode.
+    frozenset(): AggregatedChargeMode.BULK_OR_ABSORPTION,
+    frozenset({AggregatedChargeMode.BULK_OR_ABSORPTION}): AggregatedChargeMode.BULK_OR_ABSORPTION,
+    # The last battery went to Float Transition mode and all other batteries are in Float mode.
+    frozenset({AggregatedChargeMode.FLOAT_TRANSITION}): AggregatedChargeMode.FLOAT_TRANSITION,
+    frozenset({AggregatedChargeMode.FLOAT_TRANSITION, AggregatedChargeMode.FLOAT}): AggregatedChargeMode.FLOAT_TRANSITION,
+    # All batteries are in Float mode and there's no batteries in Float Transition mode.
+    frozenset({AggregatedChargeMode.FLOAT}): AggregatedChargeMode.FLOAT,
+}
+
+# Bit of each charge mode category in the mask of categories present among the batteries.
+_CHARGE_MODE_CATEGORY_BITS = {mode: 1 << (mode.value - 1) for mode in AggregatedChargeMode}
+
+# Category bit of each /Info/ChargeMode text seen so far. Batteries only report a handful of distinct texts.
+_CHARGE_MODE_BIT_CACHE: dict[str, int] = {}
+
+# The rules above expanded at import time for every (current mode, categories mask) pair, so an update is a single lookup.
+_AGGREGATED_CHARGE_MODE_TRANSITION_TABLE = {
+    (current_mode, categories_mask): _AGGREGATED_CHARGE_MODE_TRANSITIONS.get(
+        frozenset(mode for mode, bit in _CHARGE_MODE_CATEGORY_BITS.items() if categories_mask & bit), current_mode
+    )
+    for current_mode in AggregatedChargeMode
+    for categories_mask in range(1 << len(AggregatedChargeMode))
+}
+
+
+def _get_bulk_or_absorption_cvl(fn: Functions, MaxChargeVoltage_list: list, BulkOrAbsorptionCVLs: list, FloatTransitionCVLs: list):
+    # Ignore float voltages to ensure all batteries in Bulk or Absorption modes can finish charging.
+    return fn._min(BulkOrAbsorptionCVLs)
+
+
+def _get_float_transition_cvl(fn: Functions, MaxChargeVoltage_list: list, BulkOrAbsorptionCVLs: list, FloatTransitionCVLs: list):
+    # Use max CVL among all batteries in Float Transition modes, limited for safety by min CVL among all batteries in Bulk or Absorption modes.
+    cap = fn._min(BulkOrAbsorptionCVLs) if BulkOrAbsorptionCVLs else float("inf")
+    return fn._min([fn._max(FloatTransitionCVLs), cap])
+
+
+def _get_float_cvl(fn: Functions, MaxChargeVoltage_list: list, BulkOrAbsorptionCVLs: list, FloatTransitionCVLs: list):
+    return fn._min(MaxChargeVoltage_list)
+
+
+_CVL_GETTERS = {
+    AggregatedChargeMode.BULK_OR_ABSORPTION: _get_bulk_or_absorption_cvl,
+    AggregatedChargeMode.FLOAT_TRANSITION: _get_float_transition_cvl,
+    AggregatedChargeMode.FLOAT: _get_float_cvl,
+}
+
+
 def get_bus():
     """Return the shared system bus connection (singleton provided by dbus-python)."""
     return dbus.SessionBus() if "DBUS_SESSION_BUS_ADDRESS" in os.environ else dbus.SystemBus()
@@ -1570,18 +1630,14 @@ class DbusAggBatService(object):
         return True
 
     def _update_aggregated_charge_mode(self, ChargeMode_list: list):
-        if not any("Float" in mode for mode in ChargeMode_list):
-            # All batteries are in Bulk or Absorbtion mode.
-            self._set_aggregated_charge_mode(AggregatedChargeMode.BULK_OR_ABSORPTION)
-        elif any("Float Transition" in mode for mode in ChargeMode_list) and all("Float" in mode for mode in ChargeMode_list):
-            # The last battery went to Float Transition mode and all other batteries are in Float mode.
-            self._set_aggregated_charge_mode(AggregatedChargeMode.FLOAT_TRANSITION)
-        elif all("Float" in mode for mode in ChargeMode_list):
-            # All batteries are in Float mode and there's no batteries in Float Transition mode.
-            self._set_aggregated_charge_mode(AggregatedChargeMode.FLOAT)
-        else:
-            # Any other case leaves the mode unchanged.
-            pass
+        # Batteries usually share a few mode strings, so only look up the distinct ones.
+        categories_mask = 0
+        for mode in set(ChargeMode_list):
+            bit = _CHARGE_MODE_BIT_CACHE.get(mode)
+            if bit is None:
+                bit = _CHARGE_MODE_BIT_CACHE[mode] = _CHARGE_MODE_CATEGORY_BITS[_get_charge_mode_category(mode)]
+            categories_mask |= bit
+        self._set_aggregated_charge_mode(_AGGREGATED_CHARGE_MODE_TRANSITION_TABLE[self._aggregated_charge_mode, categories_mask])
 
     def _set_aggregated_charge_mode(self, mode: AggregatedChargeMode):
         if self._aggregated_charge_mode != mode:
@@ -1591,25 +1647,13 @@ class DbusAggBatService(object):
     def _get_cvl_with_aggregated_charge_mode(self, MaxChargeVoltage_list: list, ChargeMode_list: list):
         BulkOrAbsorptionCVLs = []
         FloatTransitionCVLs = []
-        FloatCVLs = []
         for voltage, mode in zip(MaxChargeVoltage_list, ChargeMode_list):
             if mode.startswith("Float Transition"):
                 FloatTransitionCVLs.append(voltage)
-            elif mode.startswith("Float"):
-                FloatCVLs.append(voltage)
-            else:
+            elif not mode.startswith("Float"):
                 BulkOrAbsorptionCVLs.append(voltage)
 
-        match self._aggregated_charge_mode:
-            case AggregatedChargeMode.BULK_OR_ABSORPTION:
-                # Ignore float voltages to ensure all batteries in Bulk or Absorption modes can finish charging.
-                return self._fn._min(BulkOrAbsorptionCVLs)
-            case AggregatedChargeMode.FLOAT_TRANSITION:
-                # Use max CVL among all batteries in Float Transition modes, limited for safety by min CVL among all batteries in Bulk or Absorption modes.
-                cap = self._fn._min(BulkOrAbsorptionCVLs) if BulkOrAbsorptionCVLs else float("inf")
-                return self._fn._min([self._fn._max(FloatTransitionCVLs), cap])
-            case AggregatedChargeMode.FLOAT:
-                return self._fn._min(MaxChargeVoltage_list)
+        return _CVL_GETTERS[self._aggregated_charge_mode](self._fn, MaxChargeVoltage_list, BulkOrAbsorptionCVLs, FloatTransitionCVLs)
 
 
 # ################
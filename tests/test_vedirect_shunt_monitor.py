@@ -0,0 +1,242 @@
+import logging
+import termios
+import vedirect_shunt_monitor
+from conftest import make_frame
+from types import SimpleNamespace
+from vedirect_shunt_monitor import DATA_EXPIRATION_SECONDS, INTERFERENCE_CHECK_INTERVAL, VeDirectParser, VeDirectShuntMonitor, _is_int
+
+import pytest
+
+# ---------------------------------------------------------------------------
+# Helpers and fixtures
+# ---------------------------------------------------------------------------
+
+
+_FIELDS = {"V": "12800", "I": "-1500", "CE": "-12345", "SOC": "955"}
+
+
+def _stream(fields: dict) -> bytes:
+    """Two consecutive frames; only the second one passes the checksum when it's the first data a parser sees."""
+    # The parser only sees a frame's checksum line once the next frame's leading "\r\n" arrives.
+    return make_frame(fields) + make_frame(fields) + b"\r\n"
+
+
+_STREAM = _stream(_FIELDS)
+
+
+@pytest.fixture
+def parser():
+    return VeDirectParser()
+
+
+def _drain(parser):
+    frames = []
+    while (frame := parser.next_frame()) is not None:
+        frames.append(frame)
+    return frames
+
+
+class _FakeSerial:
+    """Stand-in for serial.Serial that reads from the shared _FakeSerialPorts.incoming queue."""
+
+    def __init__(self, ports):
+        self._ports = ports
+        self.closed = False
+
+    def read(self, size):
+        return self._ports.incoming.pop(0) if self._ports.incoming else b""
+
+    def fileno(self):
+        if self._ports.fileno_error is not None:
+            raise self._ports.fileno_error
+        return 42
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeSerialPorts:
+    """Records the fake serial ports opened by VeDirectShuntMonitor and the termios checks made on them."""
+
+    def __init__(self):
+        self.opened = []
+        self.incoming = []
+        self.fileno_error = None
+        self.baud_rate = termios.B19200
+        self.tcgetattr_calls = 0
+
+    def open(self, **kwargs):
+        port = _FakeSerial(self)
+        self.opened.append(port)
+        return port
+
+    def tcgetattr(self, fd):
+        if not isinstance(fd, int):
+            raise TypeError(f"argument must be an int, not {type(fd).__name__}")
+        self.tcgetattr_calls += 1
+        return [0, 0, termios.CS8, 0, self.baud_rate, self.baud_rate, []]
+
+
+@pytest.fixture
+def ports(monkeypatch):
+    ports = _FakeSerialPorts()
+    monkeypatch.setattr(vedirect_shunt_monitor.serial, "Serial", ports.open, raising=False)
+    for name in ("EIGHTBITS", "PARITY_NONE", "STOPBITS_ONE"):
+        monkeypatch.setattr(vedirect_shunt_monitor.serial, name, None, raising=False)
+    monkeypatch.setattr(vedirect_shunt_monitor.termios, "tcgetattr", ports.tcgetattr)
+    return ports
+
+
+@pytest.fixture
+def monitor(ports):
+    return VeDirectShuntMonitor("/dev/ttyFAKE")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic() for the shunt monitor."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(vedirect_shunt_monitor, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+# ===========================================================================
+
+
+class TestVeDirectParser:
+
+    def test_incomplete_frame_returns_none(self, parser):
+        parser.feed(make_frame(_FIELDS))
+        assert parser.next_frame() is None
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, len(_STREAM)], ids=["byte_by_byte", "small_chunks", "single_read"])
+    def test_parses_frames_regardless_of_chunking(self, parser, chunk_size):
+        frames = []
+        for start in range(0, len(_STREAM), chunk_size):
+            parser.feed(_STREAM[start : start + chunk_size])
+            frames.extend(_drain(parser))
+
+        assert len(frames) == 2
+        assert frames[1]["_checksum_valid"] is True
+        assert {key: frames[1][key] for key in _FIELDS} == _FIELDS
+
+    def test_corrupted_frame_fails_checksum(self, parser):
+        parser.feed(_STREAM.replace(b"SOC\t955", b"SOC\t956"))
+        frames = _drain(parser)
+
+        assert len(frames) == 2
+        assert frames[1]["_checksum_valid"] is False
+
+    def test_buffer_overflow_keeps_recent_data(self, parser):
+        parser.feed(b"x" * 10000)
+        assert len(parser.buffer) == 4096
+
+        parser.feed(b"\n" + _STREAM)
+        frames = _drain(parser)
+
+        assert frames[-1]["_checksum_valid"] is True
+        assert frames[-1]["SOC"] == "955"
+
+
+class TestVeDirectShuntMonitor:
+
+    def test_checks_for_interference_every_interval(self, monitor, ports):
+        # The first update opens the port, so there's nothing to check until the next interval.
+        checked_updates = []
+        for update_number in range(1, 2 * INTERFERENCE_CHECK_INTERVAL + 2):
+            calls_before = ports.tcgetattr_calls
+            monitor.update()
+            if ports.tcgetattr_calls != calls_before:
+                checked_updates.append(update_number)
+
+        assert checked_updates == [INTERFERENCE_CHECK_INTERVAL + 1, 2 * INTERFERENCE_CHECK_INTERVAL + 1]
+
+    def test_reopens_port_on_interference(self, monitor, ports):
+        for _ in range(INTERFERENCE_CHECK_INTERVAL):
+            monitor.update()
+        assert len(ports.opened) == 1
+
+        ports.baud_rate = termios.B9600
+        monitor.update()
+
+        assert len(ports.opened) == 2
+        assert ports.opened[0].closed
+        assert monitor.ser is ports.opened[1]
+
+    def test_port_not_kept_when_fileno_fails(self, monitor, ports):
+        ports.fileno_error = OSError("bad file descriptor")
+        assert monitor.update() is None
+        assert monitor.ser is None
+        assert monitor._fd is None
+
+        # The next update opens the port again and interference checks work on it.
+        ports.fileno_error = None
+        for _ in range(INTERFERENCE_CHECK_INTERVAL + 1):
+            monitor.update()
+        assert monitor.ser is ports.opened[-1]
+        assert monitor._fd == 42
+        assert ports.tcgetattr_calls == 1
+
+
+class TestVeDirectShuntMonitorUpdate:
+
+    def test_reads_shunt_data(self, monitor, ports, clock):
+        ports.incoming.append(_stream({**_FIELDS, "VS": "12710"}))
+
+        data = monitor.update()
+
+        assert data.consumed_ah == -12.345
+        assert data.current_amps == -1.5
+        assert data.soc_percent == 95.5
+        assert data.starter_battery_voltage_volts == 12.71
+        assert data.read_timestamp == clock.now
+
+    @pytest.mark.parametrize("missing_key", ["CE", "I", "SOC"])
+    def test_frame_missing_required_field_is_skipped(self, monitor, ports, clock, missing_key):
+        ports.incoming.append(_stream({key: value for key, value in _FIELDS.items() if key != missing_key}))
+
+        assert monitor.update() is None
+        assert monitor.data is None
+
+    @pytest.mark.parametrize("bad_key", ["CE", "I", "SOC"])
+    def test_non_integer_required_field_keeps_previous_data(self, monitor, ports, clock, caplog, bad_key):
+        ports.incoming.append(_stream(_FIELDS))
+        previous = monitor.update()
+
+        ports.incoming.append(_stream({**_FIELDS, bad_key: "12a"}))
+        with caplog.at_level(logging.WARNING):
+            assert monitor.update() is previous
+
+        assert monitor.data is previous
+        assert any(record.levelno == logging.WARNING and "12a" in record.getMessage() for record in caplog.records)
+
+    def test_bad_starter_battery_voltage_still_produces_reading(self, monitor, ports, clock, caplog):
+        ports.incoming.append(_stream({**_FIELDS, "VS": "n/a"}))
+
+        with caplog.at_level(logging.WARNING):
+            data = monitor.update()
+
+        assert data.soc_percent == 95.5
+        assert data.starter_battery_voltage_volts is None
+        assert any(record.levelno == logging.WARNING and "VS" in record.getMessage() for record in caplog.records)
+
+    def test_data_expires(self, monitor, ports, clock):
+        ports.incoming.append(_stream(_FIELDS))
+        data = monitor.update()
+
+        clock.now += DATA_EXPIRATION_SECONDS
+        assert monitor.update() is data
+
+        clock.now += 0.001
+        assert monitor.update() is None
+
+
+class TestIsInt:
+
+    @pytest.mark.parametrize("value", ["0", "955", "-12345"])
+    def test_accepts_integers(self, value):
+        assert _is_int(value)
+
+    @pytest.mark.parametrize("value", ["", "-", "--5", "12.5", "1\ufffd", "ON"])
+    def test_rejects_non_integers(self, value):
+        assert not _is_int(value)
@@ -12,8 +12,12 @@ from enum import Enum
 from typing import Optional, Dict
 
 SHUNT_BAUD_RATE = 19200
-SERIAL_TIMEOUT_SECONDS = 0.5
+# Reads are non-blocking: update() only consumes what the port has already received.
+SERIAL_TIMEOUT_SECONDS = 0
+SERIAL_READ_SIZE = 4096
 DATA_EXPIRATION_SECONDS = 30
+# Check the serial port settings for interference only every N updates, as it costs a syscall.
+INTERFERENCE_CHECK_INTERVAL = 10
 
 
 class VeKey(Enum):
@@ -25,7 +29,21 @@ class VeKey(Enum):
     STARTER_BATTERY_VOLTAGE_MV = "VS"
 
 
-@dataclass
+# Plain string copies of the VeKey values, so the parsing hot path doesn't resolve enum members.
+_KEY_CHECKSUM = VeKey.CHECKSUM.value
+_KEY_CHECKSUM_VALID = VeKey.CHECKSUM_VALID.value
+_KEY_CE = VeKey.CONSUMED_MAH.value
+_KEY_I = VeKey.CURRENT_MA.value
+_KEY_SOC = VeKey.SOC_PERMILLE.value
+_KEY_VS = VeKey.STARTER_BATTERY_VOLTAGE_MV.value
+
+
+def _is_int(value: str) -> bool:
+    """Returns True if value is a VE.Direct integer field, i.e. decimal digits with an optional minus sign."""
+    return value.removeprefix("-").isdigit()
+
+
+@dataclass(slots=True, frozen=True)
 class VeDirectShuntData:
     consumed_ah: float
     current_amps: float
@@ -36,81 +54,78 @@ class VeDirectShuntData:
 
 class VeDirectParser:
     def __init__(self):
-        self.buffer = b""
+        self.buffer = bytearray()
         self.frame_data: Dict[str, str] = {}
         self.checksum = 0
 
     def feed(self, data: bytes) -> None:
         """Feed raw bytes into parser."""
-        self.buffer += data
+        self.buffer.extend(data)
         # Prevent buffer overflow
         if len(self.buffer) > 8192:
-            self.buffer = self.buffer[-4096:]
+            del self.buffer[:-4096]
             self.frame_data = {}
             self.checksum = 0
 
     def next_frame(self) -> Optional[Dict[str, str]]:
         """Returns complete frame dict when a full frame is received, None otherwise."""
-        while b"\n" in self.buffer:
-            newline_pos = self.buffer.index(b"\n")
-            line = self.buffer[:newline_pos]
-            self.checksum += sum(self.buffer[: newline_pos + 1])
-            self.buffer = self.buffer[newline_pos + 1 :]
-
-            if not line:
-                continue
+        while (newline_pos := self.buffer.find(b"\n")) >= 0:
+            self.checksum += sum(memoryview(self.buffer)[: newline_pos + 1])
 
-            try:
-                line_str = line.decode("ascii", errors="replace")
-            except Exception:
+            # Parse TAB-separated key-value pair, decoding only the key and value
+            tab_pos = self.buffer.find(b"\t", 0, newline_pos)
+            if tab_pos < 0:
+                del self.buffer[: newline_pos + 1]
                 continue
 
-            # Parse TAB-separated key-value pair
-            if "\t" in line_str:
-                parts = line_str.split("\t", 1)
-                if len(parts) == 2:
-                    key, value = parts[0].strip(), parts[1].strip()
-                    self.frame_data[key] = value
-
-                    # Checksum marks end of frame
-                    if key == VeKey.CHECKSUM.value:
-                        frame = self.frame_data.copy()
-                        frame[VeKey.CHECKSUM_VALID.value] = self._verify_checksum()
-                        self.frame_data = {}
-                        self.checksum = 0
-                        return frame
+            key = self.buffer[:tab_pos].strip().decode("ascii", errors="replace")
+            value = self.buffer[tab_pos + 1 : newline_pos].strip().decode("ascii", errors="replace")
+            del self.buffer[: newline_pos + 1]
+            self.frame_data[key] = value
+
+            # Checksum marks end of frame
+            if key == _KEY_CHECKSUM:
+                # Hand the collected dict to the caller and start a fresh one instead of copying it.
+                frame = self.frame_data
+                frame[_KEY_CHECKSUM_VALID] = self._verify_checksum()
+                self.frame_data = {}
+                self.checksum = 0
+                return frame
         return None
 
     def _verify_checksum(self) -> bool:
         """Verify VE.Direct frame checksum (sum of all bytes mod 256 == 0)."""
-        try:
-            return self.checksum & 0xFF == 0
-        except Exception:
-            return False
+        return self.checksum & 0xFF == 0
 
 
 class VeDirectShuntMonitor:
     def __init__(self, shunt_port):
         self.port = shunt_port
         self.ser = None
+        self._fd: Optional[int] = None
         self.parser = VeDirectParser()
         self.data: VeDirectShuntData = None
+        self._update_count = 0
 
     def __del__(self):
         if self.ser is not None:
             self.ser.close()
 
     def update(self) -> Optional[VeDirectShuntData]:
-        if self.ser is not None:
+        now = time.monotonic()
+        check_for_interference = self._update_count % INTERFERENCE_CHECK_INTERVAL == 0
+        self._update_count += 1
+
+        if self.ser is not None and check_for_interference:
             if self._check_for_interference():
                 # On interference, reopen the port to reset the port settings.
                 logging.warning("Interference detected, reopening serial port")
                 self.ser.close()
-                self.ser = None
+                self.ser, self._fd = None, None
 
         if self.ser is None:
             try:
-                self.ser = serial.Serial(
+                ser = serial.Serial(
                     port=self.port,
                     baudrate=SHUNT_BAUD_RATE,
                     bytesize=serial.EIGHTBITS,
@@ -118,52 +133,56 @@ class VeDirectShuntMonitor:
                     stopbits=serial.STOPBITS_ONE,
                     timeout=SERIAL_TIMEOUT_SECONDS,
                 )
+                fd = ser.fileno()
             except Exception:
                 logging.exception("Couldn't open serial port")
                 return
+            # Only keep the port once its fd is known, so the interference check never sees a port without one.
+            self.ser, self._fd = ser, fd
         try:
-            data = self.ser.read(self.ser.in_waiting or 1)
+            data = self.ser.read(SERIAL_READ_SIZE)
             if data:
                 self.parser.feed(data)
         except Exception:
             logging.exception("Couldn't read shunt data from serial port")
 
         while (frame := self.parser.next_frame()) is not None:
-            if not frame[VeKey.CHECKSUM_VALID.value]:
+            if not frame[_KEY_CHECKSUM_VALID]:
                 continue
 
-            consumed_ah = self._parse_int(frame, VeKey.CONSUMED_MAH, 1000.0)
-            current_amps = self._parse_int(frame, VeKey.CURRENT_MA, 1000.0)
-            soc_percent = self._parse_int(frame, VeKey.SOC_PERMILLE, 10.0)
-            starter_battery_voltage_volts = self._parse_int(frame, VeKey.STARTER_BATTERY_VOLTAGE_MV, 1000.0)
-
-            if consumed_ah is not None and current_amps is not None and soc_percent is not None:
-                self.data = VeDirectShuntData(
-                    consumed_ah=consumed_ah,
-                    current_amps=current_amps,
-                    soc_percent=soc_percent,
-                    starter_battery_voltage_volts=starter_battery_voltage_volts,
-                    read_timestamp=time.monotonic(),
-                )
+            consumed_mah, current_ma, soc_permille = frame.get(_KEY_CE), frame.get(_KEY_I), frame.get(_KEY_SOC)
+            if not (consumed_mah and current_ma and soc_permille):
+                continue
+
+            if not (_is_int(consumed_mah) and _is_int(current_ma) and _is_int(soc_permille)):
+                logging.warning(f"Couldn't parse shunt data: CE={consumed_mah}, I={current_ma}, SOC={soc_permille}")
+                continue
+
+            self.data = VeDirectShuntData(
+                consumed_ah=int(consumed_mah) / 1000.0,
+                current_amps=int(current_ma) / 1000.0,
+                soc_percent=int(soc_permille) / 10.0,
+                starter_battery_voltage_volts=self._parse_int(frame, _KEY_VS, 1000.0),
+                read_timestamp=now,
+            )
 
         # If there's no update or update failed this time, return previous data, but only if it's recent enough.
-        return None if self.data is None or self.data.read_timestamp < time.monotonic() - DATA_EXPIRATION_SECONDS else self.data
+        return None if self.data is None or self.data.read_timestamp < now - DATA_EXPIRATION_SECONDS else self.data
 
     @staticmethod
-    def _parse_int(frame, key_enum: VeKey, divisor: float) -> Optional[float]:
-        value = frame.get(key_enum.value)
+    def _parse_int(frame, key: str, divisor: float) -> Optional[float]:
+        value = frame.get(key)
         if value:
-            try:
+            if _is_int(value):
                 return int(value) / divisor
-            except ValueError:
-                logging.exception(f"Couldn't parse {key_enum.name} from the shunt: {value}")
+            logging.warning(f"Couldn't parse {key} from the shunt: {value}")
         return None
 
     def _check_for_interference(self) -> bool:
         """Returns True if another process changed the serial port settings."""
         try:
-            attr = termios.tcgetattr(self.ser)
-            return attr[4] != termios.B19200 or attr[5] != termios.B19200 or attr[2] & termios.CSIZE != termios.CS8
-        except Exception:
-            logging.exception("Couldn't check whether there's serial connection interference")
+            attr = termios.tcgetattr(self._fd)
+        except termios.error as err:
+            logging.warning(f"Couldn't check whether there's serial connection interference: {err}")
             return False
+        return attr[4] != termios.B19200 or attr[5] != termios.B19200 or attr[2] & termios.CSIZE != termios.CS8